@@ -145,6 +145,48 @@ def inference(network, test_loader, device):
     return accuracy
 
 
+def bulk_tensors_to_device(tensors, device):
+    """
+    Moving a list of tensors to the specified device with a single batched
+    copy instead of one dispatcher call (and CUDA memcpy) per tensor
+
+    Args:
+        tensors: list of torch.Tensor to move
+        device: CUDA device id or "cpu"
+
+    Returns:
+        List of tensors on the target device, in the same order
+    """
+    if not tensors:
+        return []
+    target = torch.device(device)
+    if (
+        target.type == "cuda"
+        and all(t.device.type == "cpu" for t in tensors)
+        and len({t.dtype for t in tensors}) == 1
+        and all(t.layout == torch.strided for t in tensors)
+    ):
+        # Stage all tensors through one pinned host buffer and issue a
+        # single asynchronous host-to-device copy on a dedicated stream,
+        # instead of one synchronous pageable transfer per tensor
+        numels = [t.numel() for t in tensors]
+        staging = torch.empty(sum(numels), dtype=tensors[0].dtype, pin_memory=True)
+        torch.cat([t.reshape(-1) for t in tensors], out=staging)
+        stream = torch.cuda.Stream(device=target)
+        with torch.cuda.stream(stream):
+            on_device = staging.to(target, non_blocking=True)
+        stream.synchronize()
+        return [
+            chunk.view(t.shape)
+            for chunk, t in zip(torch.split(on_device, numels), tensors)
+        ]
+    if hasattr(torch, "_foreach_copy_"):
+        destinations = [torch.empty_like(tensor, device=device) for tensor in tensors]
+        torch._foreach_copy_(destinations, tensors)
+        return destinations
+    return [tensor.to(device) for tensor in tensors]
+
+
 def optimizer_to_device(optimizer, device):
     """
     Sending the "torch.optim.Optimizer" object into the specified device
@@ -156,15 +198,27 @@ def optimizer_to_device(optimizer, device):
     """
     if optimizer.state_dict()["state"] != {}:
         if isinstance(optimizer, optim.SGD):
-            for param in optimizer.param_groups[0]["params"]:
-                param.data = param.data.to(device)
-                if param.grad is not None:
-                    param.grad = param.grad.to(device)
+            params = optimizer.param_groups[0]["params"]
+            params_with_grad = [param for param in params if param.grad is not None]
+            moved = bulk_tensors_to_device(
+                [param.data for param in params]
+                + [param.grad for param in params_with_grad],
+                device,
+            )
+            for param, data in zip(params, moved[: len(params)]):
+                param.data = data
+            for param, grad in zip(params_with_grad, moved[len(params):]):
+                param.grad = grad
         elif isinstance(optimizer, optim.Adam):
-            for state in optimizer.state.values():
-                for k, v in state.items():
-                    if isinstance(v, torch.Tensor):
-                        state[k] = v.to(device)
+            entries = [
+                (state, k)
+                for state in optimizer.state.values()
+                for k, v in state.items()
+                if isinstance(v, torch.Tensor)
+            ]
+            moved = bulk_tensors_to_device([state[k] for state, k in entries], device)
+            for (state, k), value in zip(entries, moved):
+                state[k] = value
     else:
         raise (ValueError("No dict keys in optimizer state: please check"))
 
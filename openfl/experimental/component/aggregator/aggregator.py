@@ -85,7 +85,7 @@ class Aggregator:
 
         self.flow = flow
         self.checkpoint = checkpoint
-        self.flow._foreach_methods = []
+        self.flow._foreach_methods = set()
         self.logger.info("MetaflowInterface creation.")
         self.flow._metaflow_interface = MetaflowInterface(self.flow.__class__, "single_process")
         self.flow._run_id = self.flow._metaflow_interface.create_run()
@@ -6,8 +6,12 @@
 
 from __future__ import annotations
 
-import inspect
+import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from types import MethodType
 from typing import Callable, List, Type
 
 from openfl.experimental.utilities import (
@@ -18,13 +22,180 @@ from openfl.experimental.utilities import (
     collaborator_to_aggregator,
     filter_attributes,
     generate_artifacts,
-    should_transfer,
 )
 
+# Runtime kinds, resolved once in the runtime setter so hot paths branch
+# on an int instead of stringifying the runtime on every call.
+_RK_LOCAL = 0
+_RK_FEDERATED = 1
+
+_transition_cache = {}
+
+
+def _transition_kind(f, parent_func):
+    """Returns the memoized transition predicates for a (f, parent) pair.
+
+    The placement predicates are deterministic functions of the two step
+    functions, so they are computed once per pair and cached, keyed by
+    qualified names (stable across the bound-method objects created on
+    every attribute access).
+
+    Args:
+        f (Callable): The next function to be executed.
+        parent_func (Callable): The previous function executed.
+
+    Returns:
+        tuple: (aggregator_to_collaborator, collaborator_to_aggregator)
+            booleans for the pair.
+    """
+    key = (f.__qualname__, parent_func.__qualname__)
+    kind = _transition_cache.get(key)
+    if kind is None:
+        kind = (
+            aggregator_to_collaborator(f, parent_func),
+            collaborator_to_aggregator(f, parent_func),
+        )
+        _transition_cache[key] = kind
+    return kind
+
+
+_IMMUTABLE_TYPES = (int, float, complex, bool, str, bytes, type(None))
+
+
+def _is_immutable(obj):
+    """Returns True if obj is a value that can be shared instead of copied.
+
+    Exact immutable builtins are shared as-is; tuples and frozensets
+    qualify only if every element does (subclasses may carry mutable
+    state, so they always take the copy path).
+    """
+    if type(obj) in _IMMUTABLE_TYPES:
+        return True
+    if type(obj) in (tuple, frozenset):
+        return all(_is_immutable(item) for item in obj)
+    return False
+
+
+def _apply_clone_updates(clone, updates):
+    """Writes a batch of attributes onto a clone.
+
+    A single __dict__.update replaces one descriptor-protocol setattr per
+    attribute; clones whose type customizes __setattr__ (such as
+    _CloneProxy) fall back to per-attribute writes.
+
+    Args:
+        clone (any): The clone to update.
+        updates (dict): Mapping of attribute names to values.
+    """
+    if type(clone).__setattr__ is object.__setattr__:
+        vars(clone).update(updates)
+    else:
+        for name, attr in updates.items():
+            setattr(clone, name, attr)
+
+
+_clone_executor = None
+
+
+def _get_clone_executor():
+    """Returns the shared thread pool used to prepare clones in parallel.
+
+    The pool is created lazily on first use; the C-level pickle and memcpy
+    portions of clone preparation release the GIL, so independent
+    per-collaborator copies overlap on multiple cores.
+    """
+    global _clone_executor
+    if _clone_executor is None:
+        _clone_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _clone_executor
+
+
+def _fast_clone(obj):
+    """Clones an object through a protocol-5 pickle round-trip.
+
+    The C pickler is substantially faster than ``copy.deepcopy`` on the
+    nested containers that make up flow state, and out-of-band buffers are
+    copied once per clone instead of being embedded in the stream. Falls
+    back to ``deepcopy`` when pickle cannot handle the object, or when
+    ``FLSpec._clone_impl`` is set to ``"deepcopy"`` (for user objects whose
+    custom ``__deepcopy__`` semantics differ from their pickle semantics).
+
+    Args:
+        obj (any): The object to clone.
+
+    Returns:
+        any: A copy of obj that shares no mutable state with the original.
+    """
+    if FLSpec._clone_impl == "deepcopy":
+        return deepcopy(obj)
+    try:
+        buffers = []
+        payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        return pickle.loads(payload, buffers=[bytearray(buffer) for buffer in buffers])
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return deepcopy(obj)
+
+
+class _CloneProxy:
+    """Copy-on-write stand-in for a collaborator clone.
+
+    Attribute reads fall through to a shared base flow instance until the
+    attribute is written, at which point the value is shadowed in a
+    per-clone overrides mapping. Methods resolved on the base are re-bound
+    to the proxy so task code writes into the overlay rather than the base.
+    Read-only state (hyperparameters, config dicts, tokenizers) is thereby
+    shared across all collaborators instead of being copied per clone.
+
+    Sharing is only safe for flows whose tasks replace attributes rather
+    than mutating them in place, so this strategy is opt-in via
+    ``FLSpec._clone_impl = "shared"``.
+    """
+
+    def __init__(self, base, overrides=None):
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_overrides", {} if overrides is None else overrides)
+        object.__setattr__(self, "_removed", set())
+
+    def __getattr__(self, name):
+        overrides = object.__getattribute__(self, "_overrides")
+        if name in overrides:
+            return overrides[name]
+        if name in object.__getattribute__(self, "_removed"):
+            raise AttributeError(name)
+        attr = getattr(object.__getattribute__(self, "_base"), name)
+        if isinstance(attr, MethodType):
+            attr = MethodType(attr.__func__, self)
+        return attr
+
+    def __setattr__(self, name, value):
+        object.__getattribute__(self, "_overrides")[name] = value
+        object.__getattribute__(self, "_removed").discard(name)
+
+    def __delattr__(self, name):
+        overrides = object.__getattribute__(self, "_overrides")
+        removed = object.__getattribute__(self, "_removed")
+        if name in overrides:
+            del overrides[name]
+            removed.add(name)
+        elif name not in removed and hasattr(object.__getattribute__(self, "_base"), name):
+            removed.add(name)
+        else:
+            raise AttributeError(name)
+
+    def __dir__(self):
+        names = set(dir(object.__getattribute__(self, "_base")))
+        names |= set(object.__getattribute__(self, "_overrides"))
+        names -= object.__getattribute__(self, "_removed")
+        return sorted(names)
+
 
 class FLSpec:
     _clones = []
     _initial_state = None
+    # Clone implementation used by _fast_clone and _create_clones:
+    # "pickle" (default), "deepcopy", or "shared" (copy-on-write proxies
+    # over a single base instance, see _CloneProxy).
+    _clone_impl = "pickle"
 
     def __init__(self, checkpoint: bool = False):
         """Initializes the FLSpec object.
@@ -33,18 +204,41 @@ class FLSpec:
             checkpoint (bool, optional): Determines whether to checkpoint or
                 not. Defaults to False.
         """
-        self._foreach_methods = []
+        self._foreach_methods = set()
         self._checkpoint = checkpoint
 
     @classmethod
     def _create_clones(cls, instance: Type[FLSpec], names: List[str]) -> None:
         """Creates clones for instance for each collaborator in names.
 
+        The instance is serialized once into a template (with large tensor /
+        ndarray payloads kept out-of-band) and deserialized once per name, so
+        the object graph is only traversed a single time regardless of the
+        number of collaborators.
+
         Args:
             instance (Type[FLSpec]): The instance to be cloned.
             names (List[str]): The list of names for the clones.
         """
-        cls._clones = {name: deepcopy(instance) for name in names}
+        if cls._clone_impl == "deepcopy":
+            cls._clones = {name: deepcopy(instance) for name in names}
+            return
+        if cls._clone_impl == "shared":
+            # Zero copies at creation: every clone is a copy-on-write view
+            # over the same base instance.
+            cls._clones = {name: _CloneProxy(instance) for name in names}
+            return
+        try:
+            buffers = []
+            template = pickle.dumps(instance, protocol=5, buffer_callback=buffers.append)
+            cls._clones = {
+                name: pickle.loads(template, buffers=[bytearray(buffer) for buffer in buffers])
+                for name in names
+            }
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Flows may reference objects that deepcopy can handle but
+            # pickle cannot; fall back to the slower per-clone deepcopy.
+            cls._clones = {name: deepcopy(instance) for name in names}
 
     @classmethod
     def _reset_clones(cls):
@@ -56,22 +250,49 @@ class FLSpec:
     def save_initial_state(cls, instance: Type[FLSpec]) -> None:
         """Saves the initial state of an instance before executing the flow.
 
+        The state is kept as a pickled blob rather than a live clone, so the
+        initial tensors are not held resident in process memory for the
+        lifetime of the flow; ``load_initial_state`` rebuilds the object on
+        demand.
+
         Args:
             instance (Type[FLSpec]): The instance whose initial state is to be
                 saved.
         """
-        cls._initial_state = deepcopy(instance)
+        if cls._clone_impl == "deepcopy":
+            cls._initial_state = deepcopy(instance)
+            return
+        try:
+            cls._initial_state = pickle.dumps(instance, protocol=5)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            cls._initial_state = deepcopy(instance)
+
+    @classmethod
+    def load_initial_state(cls) -> Type[FLSpec]:
+        """Returns a fresh copy of the saved initial state.
+
+        Mutating the returned object does not affect the stored state,
+        matching the semantics of the live deepcopy previously kept in
+        ``_initial_state``.
+
+        Returns:
+            Type[FLSpec]: The instance saved by ``save_initial_state``, or
+                None if no state was saved.
+        """
+        if isinstance(cls._initial_state, bytes):
+            return pickle.loads(cls._initial_state)
+        return cls._initial_state
 
     def run(self) -> None:
         """Starts the execution of the flow."""
 
         # Submit flow to Runtime
-        if str(self._runtime) == "LocalRuntime":
+        if self._runtime_kind == _RK_LOCAL:
             self._metaflow_interface = MetaflowInterface(self.__class__, self.runtime.backend)
             self._run_id = self._metaflow_interface.create_run()
             # Initialize aggregator private attributes
             self.runtime.initialize_aggregator()
-            self._foreach_methods = []
+            self._foreach_methods = set()
             FLSpec._reset_clones()
             FLSpec._create_clones(self, self.runtime.collaborators)
             # Initialize collaborator private attributes
@@ -104,7 +325,7 @@ class FLSpec:
                     raise e
             for name, attr in final_attributes:
                 setattr(self, name, attr)
-        elif str(self._runtime) == "FederatedRuntime":
+        elif self._runtime_kind == _RK_FEDERATED:
             pass
         else:
             raise Exception("Runtime not implemented")
@@ -131,10 +352,15 @@ class FLSpec:
         if str(runtime) not in ["LocalRuntime", "FederatedRuntime"]:
             raise TypeError(f"{runtime} is not a valid OpenFL Runtime")
         self._runtime = runtime
+        self._runtime_kind = _RK_LOCAL if str(runtime) == "LocalRuntime" else _RK_FEDERATED
 
     def _capture_instance_snapshot(self, kwargs):
         """Takes backup of self before exclude or include filtering.
 
+        Only the attributes that ``filter_attributes`` will remove are backed
+        up (as a name to value mapping), so the snapshot size scales with the
+        filter set instead of the full flow state.
+
         Args:
             kwargs: Key word arguments originally passed to the next function.
                     If include or exclude are in the kwargs, the state of the
@@ -145,7 +371,12 @@ class FLSpec:
         """
         return_objs = []
         if "exclude" in kwargs or "include" in kwargs:
-            backup = deepcopy(self)
+            _, cls_attrs = generate_artifacts(ctx=self)
+            if "include" in kwargs:
+                names_to_backup = [attr for attr in cls_attrs if attr not in kwargs["include"]]
+            else:
+                names_to_backup = [attr for attr in cls_attrs if attr in kwargs["exclude"]]
+            backup = {name: _fast_clone(getattr(self, name)) for name in names_to_backup}
             return_objs.append(backup)
         return return_objs
 
@@ -162,8 +393,8 @@ class FLSpec:
                 False otherwise.
         """
         if parent_func.__name__ in self._foreach_methods:
-            self._foreach_methods.append(f.__name__)
-            if should_transfer(f, parent_func):
+            self._foreach_methods.add(f.__name__)
+            if _transition_kind(f, parent_func)[1]:
                 print(f"Should transfer from {parent_func.__name__} to {f.__name__}")
                 self.execute_next = f.__name__
                 return True
@@ -178,10 +409,11 @@ class FLSpec:
             f (Callable): The next function to be executed.
             parent_func (Callable): The previous function executed.
         """
-        if aggregator_to_collaborator(f, parent_func):
+        agg_to_collab, collab_to_agg = _transition_kind(f, parent_func)
+        if agg_to_collab:
             print("Sending state from aggregator to collaborators")
 
-        elif collaborator_to_aggregator(f, parent_func):
+        elif collab_to_agg:
             print("Sending state from collaborator to aggregator")
 
     def filter_exclude_include(self, f, **kwargs):
@@ -202,29 +434,53 @@ class FLSpec:
         """
         selected_collaborators = getattr(self, kwargs["foreach"])
 
-        for col in selected_collaborators:
+        # The artifacts of self do not change between collaborators, so
+        # introspect them once instead of once per clone; the same goes for
+        # the exclude/include keys.
+        artifacts_iter, _ = generate_artifacts(ctx=self)
+        artifacts = list(artifacts_iter())
+        exclude = kwargs.get("exclude")
+        include = kwargs.get("include")
+        exclude_key = exclude[0] if exclude else None
+        include_key = include[0] if include else None
+
+        def _prep_clone(col):
             clone = FLSpec._clones[col]
             clone.input = col
-            if ("exclude" in kwargs and hasattr(clone, kwargs["exclude"][0])) or (
-                "include" in kwargs and hasattr(clone, kwargs["include"][0])
+            if (exclude_key and hasattr(clone, exclude_key)) or (
+                include_key and hasattr(clone, include_key)
             ):
                 filter_attributes(clone, f, **kwargs)
-            artifacts_iter, _ = generate_artifacts(ctx=self)
-            for name, attr in artifacts_iter():
-                setattr(clone, name, deepcopy(attr))
+            if not (isinstance(clone, _CloneProxy) and clone._base is self):
+                # Copy-on-write proxies over self read the artifacts through
+                # the shared base; only real clones need them materialized.
+                updates = {
+                    name: attr if _is_immutable(attr) else _fast_clone(attr)
+                    for name, attr in artifacts
+                }
+                _apply_clone_updates(clone, updates)
             clone._foreach_methods = self._foreach_methods
 
-    def restore_instance_snapshot(self, ctx: FLSpec, instance_snapshot: List[FLSpec]):
+        # Each clone is prepared independently (writes go into the clone's
+        # own __dict__, shared state is only read), so the copies can
+        # overlap on the thread pool.
+        if len(selected_collaborators) > 1:
+            list(_get_clone_executor().map(_prep_clone, selected_collaborators))
+        else:
+            for col in selected_collaborators:
+                _prep_clone(col)
+
+    def restore_instance_snapshot(self, ctx: FLSpec, instance_snapshot: List[dict]):
         """Restores attributes from backup (in instance snapshot) to ctx.
 
         Args:
             ctx (FLSpec): The context to restore the attributes to.
-            instance_snapshot (List[FLSpec]): The list of FLSpec instances
-                that serve as the backup.
+            instance_snapshot (List[dict]): The list of attribute backups
+                (name to value mappings) taken by
+                ``_capture_instance_snapshot``.
         """
         for backup in instance_snapshot:
-            artifacts_iter, _ = generate_artifacts(ctx=backup)
-            for name, attr in artifacts_iter():
+            for name, attr in backup.items():
                 if not hasattr(ctx, name):
                     setattr(ctx, name, attr)
 
@@ -232,15 +488,20 @@ class FLSpec:
         """Create, and prepare clones."""
         FLSpec._reset_clones()
         FLSpec._create_clones(self, self.runtime.collaborators)
-        selected_collaborators = self.__getattribute__(kwargs["foreach"])
+        selected_collaborators = getattr(self, kwargs["foreach"])
+
+        # Artifacts are sourced from self (the clones are freshly created)
+        # and introspected once for all collaborators.
+        artifacts_iter, _ = generate_artifacts(ctx=self)
+        artifacts = list(artifacts_iter())
 
         for col in selected_collaborators:
             clone = FLSpec._clones[col]
             clone.input = col
-            artifacts_iter, _ = generate_artifacts(ctx=clone)
-            attributes = artifacts_iter()
-            for name, attr in attributes:
-                setattr(clone, name, deepcopy(attr))
+            updates = {
+                name: attr if _is_immutable(attr) else _fast_clone(attr) for name, attr in artifacts
+            }
+            _apply_clone_updates(clone, updates)
             clone._foreach_methods = self._foreach_methods
             clone._metaflow_interface = self._metaflow_interface
 
@@ -251,29 +512,30 @@ class FLSpec:
             f (Callable): The next task that will be executed in the flow.
             **kwargs: Additional keyword arguments.
         """
-        # Get the name and reference to the calling function
-        parent = inspect.stack()[1][3]
+        # Get the name and reference to the calling function; a direct frame
+        # read avoids the source file I/O that inspect.stack() performs.
+        parent = sys._getframe(1).f_code.co_name
         parent_func = getattr(self, parent)
 
-        if str(self._runtime) == "LocalRuntime":
+        if self._runtime_kind == _RK_LOCAL:
             # Checkpoint current attributes (if checkpoint==True)
             checkpoint(self, parent_func)
 
         # Take back-up of current state of self
         agg_to_collab_ss = None
-        if aggregator_to_collaborator(f, parent_func):
+        if _transition_kind(f, parent_func)[0]:
             agg_to_collab_ss = self._capture_instance_snapshot(kwargs=kwargs)
 
-            if str(self._runtime) == "FederatedRuntime":
+            if self._runtime_kind == _RK_FEDERATED:
                 if len(FLSpec._clones) == 0:
                     self.get_clones(kwargs)
 
         # Remove included / excluded attributes from next task
         filter_attributes(self, f, **kwargs)
 
-        if str(self._runtime) == "FederatedRuntime":
+        if self._runtime_kind == _RK_FEDERATED:
             if f.collaborator_step and not f.aggregator_step:
-                self._foreach_methods.append(f.__name__)
+                self._foreach_methods.add(f.__name__)
 
             if "foreach" in kwargs:
                 self.filter_exclude_include(f, **kwargs)
@@ -289,6 +551,6 @@ class FLSpec:
             else:
                 self.execute_task_args = (self, f, parent_func, kwargs)
 
-        elif str(self._runtime) == "LocalRuntime":
+        elif self._runtime_kind == _RK_LOCAL:
             # update parameters required to execute execute_task function
             self.execute_task_args = [f, parent_func, agg_to_collab_ss, kwargs]
@@ -9,7 +9,6 @@ import gc
 import importlib
 import math
 import os
-from copy import deepcopy
 from logging import getLogger
 from typing import Any, Callable, Dict, List, Optional, Type
 
@@ -23,7 +22,6 @@ from openfl.experimental.utilities import (
     aggregator_to_collaborator,
     check_resource_allocation,
     checkpoint,
-    filter_attributes,
     generate_artifacts,
     get_number_of_gpus,
 )
@@ -577,21 +575,42 @@ class LocalRuntime(Runtime):
         for collaborator in self.__collaborators.values():
             init_private_attrs(collaborator)
 
-    def restore_instance_snapshot(self, ctx: Type[FLSpec], instance_snapshot: List[Type[FLSpec]]):
+    def restore_instance_snapshot(self, ctx: Type[FLSpec], instance_snapshot: List[dict]):
         """Restores attributes from backup (in instance snapshot) to context
         (ctx).
 
         Args:
             ctx (Type[FLSpec]): The context to restore the snapshot to.
-            instance_snapshot (List[Type[FLSpec]]): The snapshot of the
-                instance to be restored.
+            instance_snapshot (List[dict]): The list of attribute backups
+                (name to value mappings) taken by the flow before filtering.
         """
         for backup in instance_snapshot:
-            artifacts_iter, _ = generate_artifacts(ctx=backup)
-            for name, attr in artifacts_iter():
+            for name, attr in backup.items():
                 if not hasattr(ctx, name):
                     setattr(ctx, name, attr)
 
+    def _get_step_callback_ref(self, callback_name: str):
+        """Returns a Ray ObjectRef for one of the step callbacks.
+
+        The callbacks (execute_agg_steps / execute_collab_steps) are
+        identical for every remote call, so they are put into the object
+        store once per runtime and the reference is passed to the ray
+        tasks instead of reserializing the callback for every collaborator
+        on every round. Ray resolves the reference worker-side.
+
+        Args:
+            callback_name (str): Name of the step callback method.
+
+        Returns:
+            ray.ObjectRef: Reference to the serialized callback.
+        """
+        refs = getattr(self, "_step_callback_refs", None)
+        if refs is None:
+            refs = self._step_callback_refs = {}
+        if callback_name not in refs:
+            refs[callback_name] = ray.put(getattr(self, callback_name))
+        return refs[callback_name]
+
     def execute_agg_steps(self, ctx: Any, f_name: str, clones: Optional[Any] = None):
         """
         Execute aggregator steps until at transition point.
@@ -691,7 +710,7 @@ class LocalRuntime(Runtime):
                 aggregator,
                 flspec_obj,
                 f.__name__,
-                self.execute_agg_steps,
+                self._get_step_callback_ref("execute_agg_steps"),
                 clones,
             )
             flspec_obj = ray_executor.ray_call_get()[0]
@@ -721,7 +740,7 @@ class LocalRuntime(Runtime):
             flspec_obj: updated FLSpec (flow) object
         """
 
-        flspec_obj._foreach_methods.append(f.__name__)
+        flspec_obj._foreach_methods.add(f.__name__)
         selected_collaborators = getattr(flspec_obj, kwargs["foreach"])
         self.selected_collaborators = selected_collaborators
 
@@ -748,7 +767,10 @@ class LocalRuntime(Runtime):
 
             if self.backend == "ray":
                 ray_executor.ray_call_put(
-                    collaborator, clone, f.__name__, self.execute_collab_steps
+                    collaborator,
+                    clone,
+                    f.__name__,
+                    self._get_step_callback_ref("execute_collab_steps"),
                 )
             else:
                 collaborator.execute_func(clone, f.__name__, self.execute_collab_steps)
@@ -779,17 +801,12 @@ class LocalRuntime(Runtime):
             selected_collaborators: all collaborators.
         """
 
-        for col in selected_collaborators:
-            clone = FLSpec._clones[col]
-            clone.input = col
-            if ("exclude" in kwargs and hasattr(clone, kwargs["exclude"][0])) or (
-                "include" in kwargs and hasattr(clone, kwargs["include"][0])
-            ):
-                filter_attributes(clone, f, **kwargs)
-            artifacts_iter, _ = generate_artifacts(ctx=flspec_obj)
-            for name, attr in artifacts_iter():
-                setattr(clone, name, deepcopy(attr))
-            clone._foreach_methods = flspec_obj._foreach_methods
+        # FLSpec.filter_exclude_include derives the selected collaborators
+        # from kwargs["foreach"] on flspec_obj, which is how
+        # selected_collaborators was computed by the caller; delegating keeps
+        # a single implementation of the clone-preparation loop (artifacts
+        # introspected once, copies batched and parallelized).
+        FLSpec.filter_exclude_include(flspec_obj, f, **kwargs)
 
     def __repr__(self):
         """Returns the string representation of the LocalRuntime object.
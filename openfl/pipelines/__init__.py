@@ -2,12 +2,37 @@
 # SPDX-License-Identifier: Apache-2.0
 import importlib
 
-from openfl.pipelines.kc_pipeline import KCPipeline
-from openfl.pipelines.no_compression_pipeline import NoCompressionPipeline
-from openfl.pipelines.random_shift_pipeline import RandomShiftPipeline
-from openfl.pipelines.skc_pipeline import SKCPipeline
-from openfl.pipelines.stc_pipeline import STCPipeline
-from openfl.pipelines.tensor_codec import TensorCodec
-
-if importlib.util.find_spec("torch") is not None:
-    from openfl.pipelines.eden_pipeline import EdenPipeline  # NOQA
+__all__ = [
+    "EdenPipeline",
+    "KCPipeline",
+    "NoCompressionPipeline",
+    "RandomShiftPipeline",
+    "SKCPipeline",
+    "STCPipeline",
+    "TensorCodec",
+]
+
+# Lazily resolved attributes (PEP 562): importing openfl.pipelines no longer
+# loads every compression pipeline (and torch, for EdenPipeline) up front.
+_LAZY = {
+    "EdenPipeline": "openfl.pipelines.eden_pipeline",
+    "KCPipeline": "openfl.pipelines.kc_pipeline",
+    "NoCompressionPipeline": "openfl.pipelines.no_compression_pipeline",
+    "RandomShiftPipeline": "openfl.pipelines.random_shift_pipeline",
+    "SKCPipeline": "openfl.pipelines.skc_pipeline",
+    "STCPipeline": "openfl.pipelines.stc_pipeline",
+    "TensorCodec": "openfl.pipelines.tensor_codec",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        if name == "EdenPipeline" and importlib.util.find_spec("torch") is None:
+            raise AttributeError(f"{name} requires torch which is not installed")
+        module = importlib.import_module(_LAZY[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))